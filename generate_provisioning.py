@@ -5,15 +5,76 @@ Implements functional requirements RF01, RF02, RF03 from the backlog
 """
 
 import os
-import yaml
-import json
+import re
+import sys
+import functools
 from pathlib import Path
-from typing import List
-from dataclasses import dataclass
+from typing import Any, Dict, List, Set, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
+# KEY=VALUE with an optional double- or single-quoted value; bare values stop at "#"
+# Quoted values never span lines, so an unclosed quote falls through to the bare form
+_ENV_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\r\n]*)"|'([^'\r\n]*)'|([^\r\n#]*))""",
+    re.MULTILINE,
+)
+
+# O_CLOEXEC is POSIX-only; O_BINARY keeps Windows from translating newlines
+_WRITE_FLAGS = (
+    os.O_WRONLY
+    | os.O_CREAT
+    | os.O_TRUNC
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+
+# Characters with special meaning in Grafana's (JavaScript) regex syntax
+_REGEX_SPECIAL_RE = re.compile(r"[.^$*+?()\[\]{}|\\/]")
+
+# Repository lists at least this long are emitted as a prefix-trie alternation
+_TRIE_REGEX_MIN_REPOS = 32
+
+_GRAFANA_INI_TMPL = """[paths]
+provisioning = /etc/grafana/provisioning
+
+[server]
+root_url = {root_url}
+domain = {domain}
+enforce_domain = {enforce}
+
+[security]
+allow_embedding = true
+disable_gravatar = true
+cookie_secure = true
+cookie_samesite = strict
+disable_initial_admin_creation = true
+
+[auth]
+disable_login_form = true 
+oauth_auto_login = false
+
+[auth.anonymous]
+enabled = true
+org_role = Viewer
+hide_version = true
+
+[dashboards]
+default_home_dashboard_path = /var/lib/grafana/dashboards/github.json
+min_refresh_interval = 1m
 
-@dataclass
+[analytics]
+reporting_enabled = false
+check_for_updates = false
+
+[feature_toggles]
+publicDashboards = false
+accessTokenExpirationCheck = false
+"""
+
+
+@dataclass(slots=True, frozen=True)
 class GrafanaConfig:
     """Main Grafana config"""
 
@@ -23,9 +84,22 @@ class GrafanaConfig:
     server_root_url: str = "http://localhost:3000"
     server_domain: str = "localhost"
     enforce_domain: bool = True
+    # (organization, repository name) for each entry of repositories
+    repo_parts: List[Tuple[str, str]] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.repositories and not self.repo_parts:
+            # Frozen dataclass: derive the pairs for callers that did not pass them
+            repo_parts = _split_repositories(self.repositories)
+            object.__setattr__(self, "repo_parts", repo_parts)
 
 
-@dataclass
+def _split_repositories(repositories: List[str]) -> List[Tuple[str, str]]:
+    """Splits 'org/repo' entries into (org, repo) pairs"""
+    return [(repo.partition("/")[0], repo.rpartition("/")[2]) for repo in repositories]
+
+
+@dataclass(slots=True, frozen=True)
 class DatasourceConfig:
     """GitHub data source config"""
 
@@ -36,7 +110,7 @@ class DatasourceConfig:
     editable: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DashboardConfig:
     """Dashboard config"""
 
@@ -50,7 +124,7 @@ class DashboardConfig:
     path: str = "/var/lib/grafana/dashboards"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AccessControlConfig:
     """Access control config"""
 
@@ -68,29 +142,56 @@ class GrafanaProvisioningGenerator:
     Implements EP01: Monitoring Infrastructure and EP02: Custom Filtering
     """
 
+    # Directories already created by this process, shared across instances
+    _DIR_CACHE: Set[str] = set()
+
     def __init__(self, config: GrafanaConfig):
         self.config = config
         self.provisioning_dir = Path("provisioning")
         self.dashboards_dir = Path("dashboards")
+        self.datasource_path = self.provisioning_dir / "datasources" / "datasource.yaml"
+        self.dashboard_path = self.provisioning_dir / "dashboards" / "dashboard.yaml"
+        self.access_control_path = (
+            self.provisioning_dir / "access-control" / "api-permissions.yaml"
+        )
+        self.grafana_ini_path = Path("grafana.ini.template")
+        self.dashboard_config_path = Path("dashboard_config.json")
+        self._log_buf: List[str] = []
 
     def generate_all(self) -> None:
         """
         Generate all provisioning docs - US01: Painéis prontos
         """
-        self._create_directories()
-        self.generate_datasource_config()
-        self.generate_dashboard_config()
-        self.generate_access_control_config()
-        self.generate_grafana_ini()
-        self.update_dashboard_templates()
-
-        print(f"✅ Provisioning successfully generated at {datetime.now()}")
-        print(
-            f"📊 Organizations have been configured: {', '.join(self.config.organizations)}"
-        )
-        print(
-            f"📁 Repositories have been filtered: {len(self.config.repositories)} repositories"
-        )
+        try:
+            self._create_directories()
+
+            dashboard_updates = self._build_dashboard_updates()
+
+            # Everything is serialized before the first write, so a serialization
+            # error leaves the files untouched; a failed write can still stop midway
+            self._write_outputs(
+                [
+                    (self.datasource_path, self._build_datasource_yaml()),
+                    (self.dashboard_path, self._build_dashboard_yaml()),
+                    (self.access_control_path, self._build_access_control_yaml()),
+                    (self.grafana_ini_path, self._build_grafana_ini()),
+                    (
+                        self.dashboard_config_path,
+                        self._build_dashboard_config_json(dashboard_updates),
+                    ),
+                ]
+            )
+            self._log_dashboard_filters(dashboard_updates)
+
+            now = datetime.now()
+            org_names = ", ".join(self.config.organizations)
+            repo_count = len(self.config.repositories)
+
+            self._log(f"✅ Provisioning successfully generated at {now}")
+            self._log(f"📊 Organizations have been configured: {org_names}")
+            self._log(f"📁 Repositories have been filtered: {repo_count} repositories")
+        finally:
+            self._flush_log()
 
     def _create_directories(self) -> None:
         """Create required directory structure"""
@@ -102,12 +203,72 @@ class GrafanaProvisioningGenerator:
         ]
 
         for dir_path in dirs:
-            dir_path.mkdir(parents=True, exist_ok=True)
+            # Keyed on the absolute path so a chdir between runs is not mistaken
+            # for a directory that was already created
+            abs_path = os.path.abspath(dir_path)
+            if abs_path not in self._DIR_CACHE:
+                os.makedirs(abs_path, exist_ok=True)
+                self._DIR_CACHE.add(abs_path)
+
+    def _write_outputs(self, outputs: List[Tuple[Path, bytes]]) -> None:
+        """Writes pre-serialized documents to disk"""
+        for output_path, data in outputs:
+            if self._write_if_changed(output_path, data):
+                self._log(f"📄 Generated: {output_path}")
+            else:
+                self._log(f"📄 Unchanged: {output_path}")
+
+    def _log(self, line: str) -> None:
+        """Queues a status line for the next flush"""
+        self._log_buf.append(line + "\n")
+
+    def _flush_log(self) -> None:
+        """Writes queued status lines to stdout in a single call"""
+        if self._log_buf:
+            sys.stdout.write("".join(self._log_buf))
+            sys.stdout.flush()
+            self._log_buf.clear()
+
+    def _write_if_changed(self, output_path: Path, data: bytes) -> bool:
+        """
+        Writes data unless the file already holds identical content
+        Untouched files keep Grafana's provisioning watcher from reloading
+        """
+        try:
+            if output_path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            pass
+
+        try:
+            fd = os.open(output_path, _WRITE_FLAGS, 0o644)
+        except FileNotFoundError:
+            # The parent was removed after _DIR_CACHE recorded it; recreate it
+            # and retry once
+            parent = os.path.abspath(output_path.parent)
+            self._DIR_CACHE.discard(parent)
+            os.makedirs(parent, exist_ok=True)
+            self._DIR_CACHE.add(parent)
+            fd = os.open(output_path, _WRITE_FLAGS, 0o644)
+
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+        return True
 
     def generate_datasource_config(self) -> None:
         """
         Generate Github data source configuration - RF01
         """
+        self._write_outputs([(self.datasource_path, self._build_datasource_yaml())])
+        self._flush_log()
+
+    def _build_datasource_yaml(self) -> bytes:
+        """Serializes the GitHub data source provisioning document"""
         datasource_config = DatasourceConfig()
 
         config_data = {
@@ -124,16 +285,17 @@ class GrafanaProvisioningGenerator:
             ],
         }
 
-        output_path = self.provisioning_dir / "datasources" / "datasource.yaml"
-        with open(output_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
-
-        print(f"📄 Generated: {output_path}")
+        return _dump_yaml(config_data)
 
     def generate_dashboard_config(self) -> None:
         """
         Generate dashboard config - RF02
         """
+        self._write_outputs([(self.dashboard_path, self._build_dashboard_yaml())])
+        self._flush_log()
+
+    def _build_dashboard_yaml(self) -> bytes:
+        """Serializes the dashboard provider provisioning document"""
         dashboard_config = DashboardConfig()
 
         config_data = {
@@ -155,16 +317,19 @@ class GrafanaProvisioningGenerator:
             ],
         }
 
-        output_path = self.provisioning_dir / "dashboards" / "dashboard.yaml"
-        with open(output_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
-
-        print(f"📄 Gerado: {output_path}")
+        return _dump_yaml(config_data)
 
     def generate_access_control_config(self) -> None:
         """
         Generate access control config - RF03
         """
+        self._write_outputs(
+            [(self.access_control_path, self._build_access_control_yaml())]
+        )
+        self._flush_log()
+
+    def _build_access_control_yaml(self) -> bytes:
+        """Serializes the access control provisioning document"""
         access_config = AccessControlConfig()
 
         config_data = {
@@ -188,76 +353,52 @@ class GrafanaProvisioningGenerator:
             ],
         }
 
-        output_path = self.provisioning_dir / "access-control" / "api-permissions.yaml"
-        with open(output_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
-
-        print(f"📄 Generated: {output_path}")
+        return _dump_yaml(config_data)
 
     def generate_grafana_ini(self) -> None:
         """
         Generate main Grafana config - US02
         """
-        ini_content = f"""[paths]
-provisioning = /etc/grafana/provisioning
-
-[server]
-root_url = {self.config.server_root_url}
-domain = {self.config.server_domain}
-enforce_domain = {str(self.config.enforce_domain).lower()}
-
-[security]
-allow_embedding = true
-disable_gravatar = true
-cookie_secure = true
-cookie_samesite = strict
-disable_initial_admin_creation = true
-
-[auth]
-disable_login_form = true 
-oauth_auto_login = false
-
-[auth.anonymous]
-enabled = true
-org_role = Viewer
-hide_version = true
-
-[dashboards]
-default_home_dashboard_path = /var/lib/grafana/dashboards/github.json
-min_refresh_interval = 1m
-
-[analytics]
-reporting_enabled = false
-check_for_updates = false
-
-[feature_toggles]
-publicDashboards = false
-accessTokenExpirationCheck = false
-"""
-
-        with open("grafana.ini.template", "w") as f:
-            f.write(ini_content)
-
-        print("📄 Generated: grafana.ini.template")
+        self._write_outputs([(self.grafana_ini_path, self._build_grafana_ini())])
+        self._flush_log()
+
+    def _build_grafana_ini(self) -> bytes:
+        """Renders the grafana.ini template"""
+        return _GRAFANA_INI_TMPL.format_map(
+            {
+                "root_url": self.config.server_root_url,
+                "domain": self.config.server_domain,
+                "enforce": str(self.config.enforce_domain).lower(),
+            }
+        ).encode()
 
     def update_dashboard_templates(self) -> None:
         """
         Update dashboard templates based on specified filter - US03
         """
-        repo_names = [repo.split("/")[-1] for repo in self.config.repositories]
-        repo_regex = f"^({'|'.join(repo_names)})$"
+        dashboard_updates = self._build_dashboard_updates()
+        self._write_outputs(
+            [
+                (
+                    self.dashboard_config_path,
+                    self._build_dashboard_config_json(dashboard_updates),
+                )
+            ]
+        )
+        self._log_dashboard_filters(dashboard_updates)
+        self._flush_log()
 
-        org_options = []
-        for i, org in enumerate(self.config.organizations):
-            org_options.append(
-                {
-                    "selected": i == 0,
-                    "text": org,
-                    "value": org,
-                }
-            )
+    def _build_dashboard_updates(self) -> Dict[str, Any]:
+        """Builds the repository/organization filters consumed by the updater"""
+        repo_names = [name for _, name in self.config.repo_parts]
+        repo_regex = "^(" + _build_alternation(repo_names) + ")$"
+
+        org_options = [
+            {"selected": i == 0, "text": org, "value": org}
+            for i, org in enumerate(self.config.organizations)
+        ]
 
-        dashboard_updates = {
+        return {
             "repo_regex": repo_regex,
             "org_options": org_options,
             "default_org": self.config.organizations[0]
@@ -266,12 +407,102 @@ accessTokenExpirationCheck = false
             "org_list": ",".join(self.config.organizations),
         }
 
-        with open("dashboard_config.json", "w") as f:
-            json.dump(dashboard_updates, f, indent=2)
+    def _build_dashboard_config_json(self, dashboard_updates: Dict[str, Any]) -> bytes:
+        """Serializes the dashboard filter configuration"""
+        return _dump_json(dashboard_updates)
+
+    def _log_dashboard_filters(self, dashboard_updates: Dict[str, Any]) -> None:
+        """Reports the generated dashboard filters"""
+        self._log(f"🔍 Repository regex: {dashboard_updates['repo_regex']}")
+        self._log(f"🏢 Orgs: {dashboard_updates['org_list']}")
+
+
+def _dump_yaml(data: Any) -> bytes:
+    """Serializes data as block-style YAML, preferring the libyaml dumper"""
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(
+        data, Dumper=dumper, default_flow_style=False, sort_keys=False
+    ).encode()
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serializes data as 2-space indented JSON, preferring orjson"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        # ensure_ascii=False matches orjson byte-for-byte
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def _escape_regex(text: str) -> str:
+    """Escapes text for use inside a Grafana variable regex"""
+    return _REGEX_SPECIAL_RE.sub(r"\\\g<0>", text)
+
+
+def _build_alternation(names: List[str]) -> str:
+    """
+    Builds a regex alternation matching exactly the given names
+    Long lists are collapsed into a prefix trie, e.g. build(?:x|-(?:push-action|docs)),
+    so Grafana's regex engine does not retry every alternative from the start
+    """
+    names = list(dict.fromkeys(names))
+    if len(names) < _TRIE_REGEX_MIN_REPOS:
+        return "|".join(_escape_regex(name) for name in names)
+
+    trie: Dict[str, dict] = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    return _trie_to_regex(trie)
+
+
+def _trie_to_regex(node: Dict[str, dict]) -> str:
+    """Serializes a character trie into a non-capturing regex alternation"""
+    branches = [
+        _escape_regex(char) + _trie_to_regex(child)
+        for char, child in node.items()
+        if char
+    ]
+    if not branches:
+        return ""
+
+    terminal = "" in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+
+    return "(?:" + "|".join(branches) + ")" + ("?" if terminal else "")
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_env_file(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    """
+    Parses KEY=VALUE lines from an env file
+    Cached on the file's mtime and size so repeated loads skip the re-parse
+    """
+    with open(path) as f:
+        content = f.read()
+
+    values = {}
+    for match in _ENV_RE.finditer(content):
+        key, double_quoted, single_quoted, bare = match.groups()
+        if bare is not None:
+            # A stray unmatched quote is dropped, as the old strip("\"'") did
+            values[key] = bare.rstrip().strip("\"'")
+        elif double_quoted is not None:
+            values[key] = double_quoted
+        else:
+            values[key] = single_quoted
 
-        print("📄 Generated: dashboard_config.json")
-        print(f"🔍 Repository regex: {repo_regex}")
-        print(f"🏢 Orgs: {dashboard_updates['org_list']}")
+    return values
 
 
 def load_config_from_env() -> GrafanaConfig:
@@ -280,11 +511,11 @@ def load_config_from_env() -> GrafanaConfig:
     """
     env_file = Path(".env")
     if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                if line.strip() and not line.startswith("#"):
-                    key, value = line.strip().split("=", 1)
-                    os.environ[key] = value.strip("\"'")
+        stat = env_file.stat()
+        env_values = _parse_env_file(str(env_file), stat.st_mtime_ns, stat.st_size)
+        for key, value in env_values.items():
+            if os.environ.get(key) != value:
+                os.environ[key] = value
 
     github_token = os.getenv("GITHUB_TOKEN", "")
     repos_str = os.getenv("REPOS", "")
@@ -296,12 +527,14 @@ def load_config_from_env() -> GrafanaConfig:
         raise ValueError("REPOS env var is required (format: 'org1/repo1, org2/repo2')")
 
     repositories = [repo.strip() for repo in repos_str.split(",")]
-    organizations = list(set(repo.split("/")[0] for repo in repositories))
+    repo_parts = _split_repositories(repositories)
+    organizations = list(dict.fromkeys(org for org, _ in repo_parts))
 
     return GrafanaConfig(
         github_token=github_token,
         organizations=organizations,
         repositories=repositories,
+        repo_parts=repo_parts,
         server_root_url=os.getenv("GF_SERVER_ROOT_URL", "http://localhost:3000"),
         server_domain=os.getenv("GF_SERVER_DOMAIN", "localhost"),
         enforce_domain=os.getenv("GF_SERVER_ENFORCE_DOMAIN", "true").lower() == "true",
@@ -328,4 +561,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
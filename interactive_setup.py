@@ -3,14 +3,24 @@
 Interactive GitHub Monitoring System Configuration
 """
 
+import io
 import os
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List
 from dataclasses import dataclass
+from datetime import datetime
 
 
-@dataclass
+_REPO_RE = re.compile(r"^[a-zA-Z0-9._-]+/[a-zA-Z0-9._-]+\Z")
+_GH_TOKEN_RES = (
+    re.compile(r"^gh[sp]_[A-Za-z0-9_]{36,}\Z"),
+    re.compile(r"^[a-f0-9]{40}\Z"),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class SetupConfig:
     """Complete setup configuration"""
 
@@ -117,9 +127,7 @@ class InteractiveSetup:
                 continue
 
             # Basic format validation
-            if not re.match(r"^gh[sp]_[A-Za-z0-9_]{36,}$", token) and not re.match(
-                r"^[a-f0-9]{40}$", token
-            ):
+            if not any(r.match(token) for r in _GH_TOKEN_RES):
                 print("⚠️  Token format might be incorrect, but proceeding...")
 
             return token
@@ -132,6 +140,7 @@ class InteractiveSetup:
         print("📝 Enter the repositories you want to monitor")
         print("📋 Format: organization/repository (e.g: docker/buildx)")
         print("💡 You can add multiple repositories")
+        print("💡 Type 'paste' to enter several repositories at once")
 
         repositories = []
 
@@ -161,6 +170,10 @@ class InteractiveSetup:
                     print("❌ Add at least one repository")
                     continue
 
+            if repo.lower() == "paste":
+                self._paste_repositories(repositories)
+                continue
+
             if not self._validate_repository_format(repo):
                 print("❌ Invalid format. Use: organization/repository")
                 continue
@@ -174,17 +187,46 @@ class InteractiveSetup:
 
         return repositories
 
+    def _paste_repositories(self, repositories: List[str]) -> None:
+        """
+        Reads a pasted block of repositories, ended by an empty line
+        Entries may be separated by spaces, commas or new lines
+        """
+        print("📋 Paste the repositories, then press Enter on an empty line:")
+
+        lines = []
+        while True:
+            line = input().strip()
+            if not line:
+                break
+            lines.append(line)
+
+        candidates = dict.fromkeys(" ".join(lines).replace(",", " ").split())
+        invalid = [c for c in candidates if not self._validate_repository_format(c)]
+        duplicates = [c for c in candidates if c in repositories]
+
+        for candidate in candidates:
+            if candidate not in invalid and candidate not in duplicates:
+                repositories.append(candidate)
+                print(f"✅ Added: {candidate}")
+
+        if duplicates:
+            print(f"⚠️  Already added: {', '.join(duplicates)}")
+        if invalid:
+            print(
+                f"❌ Invalid format (use organization/repository): {', '.join(invalid)}"
+            )
+
     def _validate_repository_format(self, repo: str) -> bool:
         """Validates repository format"""
-        pattern = r"^[a-zA-Z0-9._-]+/[a-zA-Z0-9._-]+$"
-        return bool(re.match(pattern, repo))
+        return _REPO_RE.match(repo) is not None
 
     def _extract_organizations(self, repositories: List[str]) -> List[str]:
         """
         Extracts unique organizations from repositories
         RF02: Statistics by organization
         """
-        orgs = list(set(repo.split("/")[0] for repo in repositories))
+        orgs = list(dict.fromkeys(repo.partition("/")[0] for repo in repositories))
 
         print(f"\n🏢 Organizations detected: {', '.join(orgs)}")
         return orgs
@@ -267,33 +309,42 @@ SETUP_MODE={self.config.setup_mode}
         Shows configuration summary
         US01, US02, US03: Configuration confirmation
         """
-        print("\n" + "=" * 60)
-        print("📋 CONFIGURATION SUMMARY")
-        print("=" * 60)
-        print(f"🔧 Setup mode:        {self.config.setup_mode.title()}")
-        print(f"🔑 GitHub token:      Configured (...{self.config.github_token[-6:]})")
+        buf = io.StringIO()
+
+        print("\n" + "=" * 60, file=buf)
+        print("📋 CONFIGURATION SUMMARY", file=buf)
+        print("=" * 60, file=buf)
+        print(f"🔧 Setup mode:        {self.config.setup_mode.title()}", file=buf)
         print(
-            f"🏢 Organizations:     {len(self.config.organizations)} ({', '.join(self.config.organizations)})"
+            f"🔑 GitHub token:      Configured (...{self.config.github_token[-6:]})",
+            file=buf,
         )
-        print(f"📁 Repositories:      {len(self.config.repositories)}")
+        print(
+            f"🏢 Organizations:     {len(self.config.organizations)} ({', '.join(self.config.organizations)})",
+            file=buf,
+        )
+        print(f"📁 Repositories:      {len(self.config.repositories)}", file=buf)
         for i, repo in enumerate(self.config.repositories, 1):
-            print(f"   {i:2d}. {repo}")
-        print(f"🌐 Server URL:        {self.config.server_url}")
-        print(f"🌍 Domain:           {self.config.server_domain}")
-        print(f"🔒 Enforce domain:   {'Yes' if self.config.enforce_domain else 'No'}")
-        print("=" * 60)
+            print(f"   {i:2d}. {repo}", file=buf)
+        print(f"🌐 Server URL:        {self.config.server_url}", file=buf)
+        print(f"🌍 Domain:           {self.config.server_domain}", file=buf)
+        print(
+            f"🔒 Enforce domain:   {'Yes' if self.config.enforce_domain else 'No'}",
+            file=buf,
+        )
+        print("=" * 60, file=buf)
 
-        print("\n🎯 NEXT STEPS:")
-        print("1. Run: python3 generate_provisioning.py")
-        print("2. Run: python3 update_dashboards.py")
-        print("3. Run: docker-compose up -d")
-        print("4. Access: " + self.config.server_url)
-        print("\n✨ Setup completed successfully!")
+        print("\n🎯 NEXT STEPS:", file=buf)
+        print("1. Run: python3 generate_provisioning.py", file=buf)
+        print("2. Run: python3 update_dashboards.py", file=buf)
+        print("3. Run: docker-compose up -d", file=buf)
+        print("4. Access: " + self.config.server_url, file=buf)
+        print("\n✨ Setup completed successfully!", file=buf)
+
+        sys.stdout.write(buf.getvalue())
 
     def _get_timestamp(self) -> str:
         """Returns current timestamp"""
-        from datetime import datetime
-
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
@@ -344,4 +395,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -5,6 +5,7 @@ GitHub Dashboard Automatic Updater
 
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -253,4 +254,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())